@@ -1,13 +1,28 @@
 import os
+import re
 import sys
+import stat
+import math
 import time
+import html
 import random
 import json
-import requests
+import base64
+import ipaddress
+import urllib.parse
+import hashlib
+import tempfile
+import asyncio
+import threading
+import multiprocessing
+import aiohttp
 import geocoder  # For IP-based "Find Restaurants Near Me"
 
 from geopy.geocoders import Nominatim
 from geopy.distance import geodesic
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLineEdit,
@@ -15,8 +30,8 @@ from PySide6.QtWidgets import (
     QLabel, QTextEdit, QMessageBox, QCheckBox, QProgressBar, QFrame, QGraphicsOpacityEffect,
     QTabWidget, QComboBox, QScrollArea
 )
-from PySide6.QtCore import Qt, QThread, Signal, QTimer, QPropertyAnimation
-from PySide6.QtGui import QPixmap, QIcon, QFont
+from PySide6.QtCore import Qt, QObject, Signal, QTimer, QPropertyAnimation, QPointF, QRectF
+from PySide6.QtGui import QPixmap, QImage, QIcon, QFont, QPainter, QColor, QPen
 
 # Replace with your actual Google Places API Key.
 GOOGLE_PLACES_API_KEY = "REPLACE WITH GOOGLE API KEY"
@@ -25,8 +40,34 @@ GOOGLE_PLACES_API_KEY = "REPLACE WITH GOOGLE API KEY"
 # Global Caches for Optimization
 # -----------------------------
 geocode_cache = {}   # { location_query : (lat, lon) }
-places_cache = {}    # { location_query : [results, ...] }
+places_cache = {}    # { location_query : ([results, ...], fetched_at) }
 image_cache = {}     # { (photo_reference, max_width) : QPixmap }
+details_cache = {}   # { place_id : (details, fetched_at) }
+ip_location_cache = {}  # { "me" : ((lat, lon), fetched_at) }
+summary_cache = {}   # { "place_id:reviews_hash" : summary }, persisted to SUMMARY_CACHE_FILE
+
+SUMMARY_CACHE_FILE = "summary_cache.json"
+SUMMARY_CACHE_MAX_ENTRIES = 2000  # Least recently used summaries are dropped above this count
+SUMMARY_PREFETCH_COUNT = 5        # Top search results whose details are fetched ahead for summaries
+DETAILS_FRESH_SECONDS = 60 * 60   # Prefetched or opened details are reused for this long
+PHOTO_CACHE_DIR = "photo_cache"
+PHOTO_CACHE_MAX_BYTES = 200 * 1024 * 1024  # Least recently used photos are evicted above this size
+
+IP_LOCATION_TTL = 15 * 60  # Seconds before the IP location is looked up again
+IP_LOOKUP_TIMEOUT = 5      # Seconds; bounds how long an in-flight lookup can hold up quitting
+PLACES_FRESH_SECONDS = 10 * 60  # Cached search results older than this are refreshed in the background
+
+# Optional shared cache server, e.g. "unix:/tmp/foodfinder-cache.sock" or "127.0.0.1:8765".
+# When set, lookups consult it before the network and the caches above act as a near cache.
+CACHE_SERVER_ADDRESS = os.environ.get("FOODFINDER_CACHE_SERVER", "")
+DEFAULT_CACHE_SERVER_ADDRESS = "127.0.0.1:8765"
+CACHE_SERVER_MAX_BYTES = 512 * 1024 * 1024
+CACHE_SERVER_LEASE_SECONDS = 15   # How long other clients wait on one client's in-flight fetch
+CACHE_SERVER_RETRY_SECONDS = 30   # Back-off before reconnecting to an unreachable server
+CACHE_SERVER_LINE_LIMIT = 16 * 1024 * 1024
+GEOCODE_SHARED_TTL = 7 * 24 * 60 * 60
+DETAILS_SHARED_TTL = 24 * 60 * 60
+PHOTO_SHARED_TTL = 30 * 24 * 60 * 60
 
 # -----------------------------
 # Updated Style Sheets with Rounded Corners
@@ -73,26 +114,416 @@ QTabBar::tab { background-color: #23272A; color: #DCDDDE; padding: 10px; border-
 QTabBar::tab:selected { background-color: #7289DA; }
 """
 
+# -----------------------------
+# Shared Cache Server (Optional, shared by every app instance on this machine)
+# -----------------------------
+# Protocol: one JSON object per line in each direction, matched up by "id".
+#   {"op": "get", "ns", "key", "lease": bool} -> {"hit": true, "value"} or {"hit": false, "lease": bool}
+#   {"op": "put", "ns", "key", "value", "ttl"} -> {"ok": true}
+#   {"op": "release", "ns", "key"}            -> {"ok": true}
+# A get that misses with "lease" set makes the caller responsible for fetching the entry. Other
+# clients asking for the same entry meanwhile wait for its put instead of fetching it again.
+# The protocol is unauthenticated, so it is confined to a Unix socket or a loopback address.
+def parseCacheAddress(address):
+    if address.startswith("unix:"):
+        return "unix", address[len("unix:"):], None
+    host, _, port = address.rpartition(":")
+    host = host.strip("[]") or "127.0.0.1"
+    if host != "localhost" and not ipaddress.ip_address(host).is_loopback:
+        raise ValueError(f"Cache server address must be a Unix socket or loopback, not {host}")
+    return "tcp", host, int(port)
+
+
+class CacheServer:
+    def __init__(self, max_bytes=CACHE_SERVER_MAX_BYTES, lease_seconds=CACHE_SERVER_LEASE_SECONDS):
+        self.max_bytes = max_bytes
+        self.lease_seconds = lease_seconds
+        self.entries = OrderedDict()  # { (ns, key) : (value, size, expires_at) }, least recently used first
+        self.total_bytes = 0
+        self.leases = {}              # { (ns, key) : Future resolved by the holder's put or release }
+
+    def lookup(self, entry_key):
+        entry = self.entries.get(entry_key)
+        if entry is None:
+            return None
+        value, size, expires_at = entry
+        if time.time() >= expires_at:
+            self.remove(entry_key)
+            return None
+        self.entries.move_to_end(entry_key)
+        return value
+
+    def store(self, entry_key, value, ttl):
+        size = len(json.dumps(value))
+        if entry_key in self.entries:
+            self.remove(entry_key)
+        self.entries[entry_key] = (value, size, time.time() + ttl)
+        self.total_bytes += size
+        self.evict()
+
+    def remove(self, entry_key):
+        _, size, _ = self.entries.pop(entry_key)
+        self.total_bytes -= size
+
+    def evict(self):
+        if self.total_bytes <= self.max_bytes:
+            return
+        now = time.time()
+        for entry_key in [k for k, (_, _, expires_at) in self.entries.items() if expires_at <= now]:
+            self.remove(entry_key)
+        while self.total_bytes > self.max_bytes and self.entries:
+            self.remove(next(iter(self.entries)))
+
+    def endLease(self, entry_key):
+        lease = self.leases.pop(entry_key, None)
+        if lease is not None and not lease.done():
+            lease.set_result(None)
+
+    async def handleGet(self, request, held):
+        entry_key = (request["ns"], request["key"])
+        while True:
+            value = self.lookup(entry_key)
+            if value is not None:
+                return {"hit": True, "value": value}
+            if not request.get("lease"):
+                return {"hit": False, "lease": False}
+            lease = self.leases.get(entry_key)
+            if lease is None:
+                lease = asyncio.get_running_loop().create_future()
+                self.leases[entry_key] = lease
+                held.add(entry_key)
+                asyncio.get_running_loop().call_later(self.lease_seconds, self.expireLease, entry_key, lease)
+                return {"hit": False, "lease": True}
+            # Another client is fetching this entry; wait for it, then look again. If it
+            # failed or vanished, the next pass hands the lease to this client.
+            await asyncio.shield(lease)
+
+    def expireLease(self, entry_key, lease):
+        if self.leases.get(entry_key) is lease:
+            self.endLease(entry_key)
+
+    async def dispatch(self, request, held):
+        op = request.get("op")
+        if op == "get":
+            return await self.handleGet(request, held)
+        entry_key = (request.get("ns"), request.get("key"))
+        if op == "put":
+            self.store(entry_key, request["value"], float(request.get("ttl", 3600)))
+            held.discard(entry_key)
+            self.endLease(entry_key)
+            return {"ok": True}
+        if op == "release":
+            held.discard(entry_key)
+            self.endLease(entry_key)
+            return {"ok": True}
+        return {"error": f"Unknown op: {op}"}
+
+    async def handleClient(self, reader, writer):
+        held = set()          # Leases this connection must give back if it disconnects
+        tasks = set()
+        write_lock = asyncio.Lock()
+
+        async def respond(request):
+            try:
+                reply = await self.dispatch(request, held)
+            except Exception as e:
+                reply = {"error": str(e)}
+            reply["id"] = request.get("id")
+            async with write_lock:
+                writer.write(json.dumps(reply).encode("utf-8") + b"\n")
+                await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    break  # Same as malformed JSON: the peer is not speaking this protocol
+                task = asyncio.ensure_future(respond(request))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            for task in list(tasks):
+                task.cancel()
+            for entry_key in list(held):
+                self.endLease(entry_key)
+            writer.close()
+
+    async def serve(self, address):
+        kind, host, port = parseCacheAddress(address)
+        if kind == "unix":
+            if os.path.lexists(host):
+                # Only clear a stale socket from an earlier run, never some other file.
+                if not stat.S_ISSOCK(os.lstat(host).st_mode):
+                    raise ValueError(f"{host} exists and is not a socket")
+                os.remove(host)
+            # Create the socket owner-only from the start so no other user can connect.
+            old_umask = os.umask(0o177)
+            try:
+                server = await asyncio.start_unix_server(self.handleClient, path=host, limit=CACHE_SERVER_LINE_LIMIT)
+            finally:
+                os.umask(old_umask)
+        else:
+            server = await asyncio.start_server(self.handleClient, host, port, limit=CACHE_SERVER_LINE_LIMIT)
+        print(f"FoodFinder cache server listening on {address}")
+        async with server:
+            await server.serve_forever()
+
+
+def runCacheServer(address):
+    try:
+        asyncio.run(CacheServer().serve(address))
+    except ValueError as e:
+        print("Error starting cache server:", e)
+    except KeyboardInterrupt:
+        pass
+
+
+class SharedCacheClient:
+    # Lives on the NetworkEngine loop. Every failure to reach the server falls back to
+    # fetching directly, so the app behaves as before when no server is running.
+    def __init__(self, address):
+        self.address = address
+        self.reader = None
+        self.writer = None
+        self.read_task = None
+        self.connect_lock = None
+        self.replies = {}  # { request id : Future }
+        self.next_id = 0
+        self.retry_at = 0.0
+
+    async def connect(self):
+        if self.writer is not None:
+            return True
+        if self.connect_lock is None:
+            self.connect_lock = asyncio.Lock()
+        async with self.connect_lock:
+            if self.writer is not None:
+                return True
+            if time.time() < self.retry_at:
+                return False
+            try:
+                kind, host, port = parseCacheAddress(self.address)
+                if kind == "unix":
+                    self.reader, self.writer = await asyncio.open_unix_connection(host, limit=CACHE_SERVER_LINE_LIMIT)
+                else:
+                    self.reader, self.writer = await asyncio.open_connection(host, port, limit=CACHE_SERVER_LINE_LIMIT)
+            except (OSError, ValueError) as e:
+                print("Shared cache unavailable:", e)
+                self.retry_at = time.time() + CACHE_SERVER_RETRY_SECONDS
+                return False
+            self.read_task = asyncio.ensure_future(self.readReplies(self.reader))
+            return True
+
+    async def readReplies(self, reader):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                reply = json.loads(line)
+                future = self.replies.pop(reply.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(reply)
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            self.disconnect()
+
+    def disconnect(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = None
+        self.writer = None
+        self.retry_at = time.time() + CACHE_SERVER_RETRY_SECONDS
+        replies, self.replies = self.replies, {}
+        for future in replies.values():
+            if not future.done():
+                future.set_exception(ConnectionError("Shared cache connection lost"))
+
+    async def call(self, request, timeout):
+        if not await self.connect():
+            raise ConnectionError("Shared cache unavailable")
+        self.next_id += 1
+        request["id"] = self.next_id
+        future = asyncio.get_running_loop().create_future()
+        self.replies[self.next_id] = future
+        try:
+            self.writer.write(json.dumps(request).encode("utf-8") + b"\n")
+            await self.writer.drain()
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self.replies.pop(request["id"], None)
+
+    async def notify(self, request):
+        try:
+            await self.call(request, timeout=5)
+        except (OSError, ConnectionError, asyncio.TimeoutError):
+            pass
+
+    async def fetchThrough(self, namespace, key, ttl, fetch):
+        try:
+            reply = await self.call(
+                {"op": "get", "ns": namespace, "key": key, "lease": True},
+                timeout=CACHE_SERVER_LEASE_SECONDS * 2
+            )
+        except (OSError, ConnectionError, asyncio.TimeoutError):
+            return await fetch()
+        if reply.get("hit"):
+            return reply["value"]
+        try:
+            value = await fetch()
+        except BaseException:
+            if reply.get("lease"):
+                await asyncio.shield(self.notify({"op": "release", "ns": namespace, "key": key}))
+            raise
+        await self.notify({"op": "put", "ns": namespace, "key": key, "value": value, "ttl": ttl})
+        return value
+
+    async def close(self):
+        if self.read_task is not None:
+            self.read_task.cancel()
+        self.disconnect()
+
+# -----------------------------
+# NetworkEngine (asyncio loop running alongside the Qt event loop)
+# -----------------------------
+class NetworkEngine(QObject):
+    # Runs an asyncio loop with a shared aiohttp session on a background thread so geocoding,
+    # search pages, details and photos can all be in flight at once. Coroutines are submitted
+    # from the GUI thread and their callbacks are delivered back to it through task_finished.
+    task_finished = Signal(object, object)  # callback, result
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.loop = asyncio.new_event_loop()
+        self.session = None
+        self.shared_cache = SharedCacheClient(CACHE_SERVER_ADDRESS) if CACHE_SERVER_ADDRESS else None
+        self.task_finished.connect(self.onTaskFinished)
+        self.thread = threading.Thread(target=self.runLoop, name="NetworkEngine", daemon=True)
+        self.thread.start()
+
+    def runLoop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro, on_result=None, on_error=None):
+        # Returns a concurrent.futures.Future; cancelling it cancels the coroutine and any
+        # requests it is awaiting. Cancelled tasks never invoke their callbacks.
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+        def done(f):
+            if f.cancelled():
+                return
+            error = f.exception()
+            if error is None:
+                self.task_finished.emit(on_result, f.result())
+            elif on_error is not None:
+                self.task_finished.emit(on_error, str(error))
+            else:
+                print("Network task failed:", error)
+
+        future.add_done_callback(done)
+        return future
+
+    def onTaskFinished(self, callback, result):
+        if callback is not None:
+            callback(result)
+
+    async def getSession(self):
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(limit=16)
+            )
+        return self.session
+
+    async def getJson(self, url, params):
+        session = await self.getSession()
+        async with session.get(url, params=params) as response:
+            if response.status != 200:
+                return response.status, None
+            return response.status, await response.json(content_type=None)
+
+    async def getBytes(self, url, params):
+        session = await self.getSession()
+        async with session.get(url, params=params) as response:
+            if response.status != 200:
+                return response.status, None
+            return response.status, await response.read()
+
+    async def cached(self, namespace, key, ttl, fetch):
+        # Consults the shared cache server, when one is configured, before awaiting fetch().
+        # Values must be JSON-serializable so they can be shared.
+        if self.shared_cache is None:
+            return await fetch()
+        return await self.shared_cache.fetchThrough(namespace, key, ttl, fetch)
+
+    async def runBlocking(self, func, *args):
+        # For synchronous libraries and disk I/O, which would otherwise stall the loop.
+        return await self.loop.run_in_executor(None, func, *args)
+
+    def shutdown(self):
+        if not self.thread.is_alive():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.closeAll(), self.loop).result(timeout=2)
+        except Exception:
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=2)
+
+    async def closeAll(self):
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self.shared_cache is not None:
+            await self.shared_cache.close()
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
 # -----------------------------
 # RestaurantSearchWorker (Optimized for initial search)
 # -----------------------------
-class RestaurantSearchWorker(QThread):
+class RestaurantSearchWorker(QObject):
     results_ready = Signal(list)
+    results_refreshed = Signal(list)
     error_occurred = Signal(str)
+    finished = Signal()
 
-    def __init__(self, location_query, parent=None):
+    def __init__(self, engine, location_query, parent=None):
         super().__init__(parent)
+        self.engine = engine
         self.location_query = location_query
         self.radius = 5000  # 5 km
         self.center = None
         self.max_pages = 1  # Fetch only the first page
+        self.future = None
 
-    def run(self):
-        try:
-            if self.location_query in places_cache:
-                self.results_ready.emit(places_cache[self.location_query])
-                return
+    def start(self):
+        self.future = self.engine.submit(self.run())
+
+    def cancel(self):
+        if self.future is not None:
+            self.future.cancel()
+
+    def geocode(self, query):
+        geolocator = Nominatim(user_agent="restaurant_finder_app")
+        location = geolocator.geocode(query)
+        if not location:
+            raise Exception("Unable to geocode the provided location.")
+        return location.latitude, location.longitude
 
+    async def run(self):
+        # Signals emitted here are queued to the GUI thread.
+        served_stale = False
+        try:
             if self.location_query in geocode_cache:
                 lat, lon = geocode_cache[self.location_query]
             else:
@@ -107,42 +538,824 @@ class RestaurantSearchWorker(QThread):
                     query = self.location_query.strip()
                     if ',' not in query:
                         query = f"{query}, USA"
-                    geolocator = Nominatim(user_agent="restaurant_finder_app")
-                    location = geolocator.geocode(query)
-                    if not location:
-                        raise Exception("Unable to geocode the provided location.")
-                    lat, lon = location.latitude, location.longitude
+                    lat, lon = await self.engine.cached(
+                        "geocode", query, GEOCODE_SHARED_TTL,
+                        lambda: self.engine.runBlocking(self.geocode, query)
+                    )
                 geocode_cache[self.location_query] = (lat, lon)
 
+            # Resolve the center first (a cache hit for any cached search) so the
+            # map can place cached results relative to it.
             self.center = (lat, lon)
-            url = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
-            params = {
-                "location": f"{lat},{lon}",
-                "radius": self.radius,
-                "type": "restaurant",
-                "key": GOOGLE_PLACES_API_KEY
-            }
-            results = []
-            page_count = 0
-            while True:
-                response = requests.get(url, params=params)
-                if response.status_code != 200:
-                    raise Exception(f"Google Places API error: {response.status_code}")
-                data = response.json()
-                if data.get("status") not in ("OK", "ZERO_RESULTS"):
-                    raise Exception(f"Google Places API error: {data.get('status')}")
-                results.extend(data.get("results", []))
-                page_count += 1
-                next_page_token = data.get("next_page_token")
-                if next_page_token and page_count < self.max_pages:
-                    params["pagetoken"] = next_page_token
-                    time.sleep(2)
-                else:
-                    break
-            places_cache[self.location_query] = results
-            self.results_ready.emit(results)
+
+            # Stale-while-revalidate: render cached results at once and only hit
+            # the network when the entry has outlived PLACES_FRESH_SECONDS.
+            if self.location_query in places_cache:
+                cached_results, fetched_at = places_cache[self.location_query]
+                self.results_ready.emit(cached_results)
+                if time.time() - fetched_at < PLACES_FRESH_SECONDS:
+                    return
+                served_stale = True
+
+            # The shared entry expires with the freshness window, so a peer's result is never stale.
+            entry = await self.engine.cached(
+                "places", self.location_query, PLACES_FRESH_SECONDS,
+                lambda: self.fetchPlaces(lat, lon)
+            )
+            results = entry["results"]
+            places_cache[self.location_query] = (results, entry["fetched_at"])
+            if served_stale:
+                self.results_refreshed.emit(results)
+            else:
+                self.results_ready.emit(results)
         except Exception as e:
-            self.error_occurred.emit(str(e))
+            if served_stale:
+                # The stale results are already on screen; keep them rather than interrupting the user.
+                print("Error refreshing search results:", e)
+            else:
+                self.error_occurred.emit(str(e))
+        finally:
+            self.finished.emit()
+
+    async def fetchPlaces(self, lat, lon):
+        url = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
+        params = {
+            "location": f"{lat},{lon}",
+            "radius": self.radius,
+            "type": "restaurant",
+            "key": GOOGLE_PLACES_API_KEY
+        }
+        results = []
+        page_count = 0
+        while True:
+            status_code, data = await self.engine.getJson(url, params)
+            if data is None:
+                raise Exception(f"Google Places API error: {status_code}")
+            if data.get("status") not in ("OK", "ZERO_RESULTS"):
+                raise Exception(f"Google Places API error: {data.get('status')}")
+            results.extend(data.get("results", []))
+            page_count += 1
+            next_page_token = data.get("next_page_token")
+            if next_page_token and page_count < self.max_pages:
+                params["pagetoken"] = next_page_token
+                await asyncio.sleep(2)
+            else:
+                break
+        return {"results": results, "fetched_at": time.time()}
+
+def restaurantChanged(old, new):
+    # Fields surfaced in the list or its filters that a refresh is expected to change.
+    return (
+        old.get("name") != new.get("name")
+        or old.get("vicinity") != new.get("vicinity")
+        or old.get("rating") != new.get("rating")
+        or old.get("user_ratings_total") != new.get("user_ratings_total")
+        or old.get("price_level") != new.get("price_level")
+        or old.get("opening_hours", {}).get("open_now") != new.get("opening_hours", {}).get("open_now")
+    )
+
+# -----------------------------
+# Review Summarizer (Local extractive "AI Summary")
+# -----------------------------
+SUMMARY_STOPWORDS = {
+    "a", "about", "after", "again", "all", "also", "am", "an", "and", "any", "are", "as", "at",
+    "be", "because", "been", "before", "being", "but", "by", "can", "could", "did", "do", "does",
+    "doing", "don't", "even", "for", "from", "get", "got", "had", "has", "have", "he", "her", "here",
+    "him", "his", "how", "i", "i'm", "i've", "if", "in", "into", "is", "it", "it's", "its", "just",
+    "me", "more", "most", "my", "no", "not", "of", "on", "one", "only", "or", "our", "out", "over",
+    "place", "restaurant", "really", "she", "so", "some", "than", "that", "the", "their", "them",
+    "then", "there", "they", "this", "to", "too", "up", "us", "very", "was", "we", "were", "what",
+    "when", "which", "while", "who", "will", "with", "would", "you", "your",
+}
+
+
+def reviewsHash(reviews):
+    payload = json.dumps(
+        [(r.get("author_name"), r.get("rating"), r.get("text")) for r in reviews],
+        sort_keys=True
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def summaryKey(place_id, reviews):
+    return f"{place_id}:{reviewsHash(reviews)}"
+
+
+def summarizeReviews(reviews, max_sentences=3):
+    # Frequency-based extractive summary: score each sentence by how many of the
+    # reviews' most common words it contains and keep the best few in original order.
+    sentences = []
+    for review in reviews:
+        text = (review.get("text") or "").strip()
+        for sentence in re.split(r"(?<=[.!?])\s+", text):
+            words = re.findall(r"[a-z']+", sentence.lower())
+            if 4 <= len(words) <= 40:
+                sentences.append((sentence.strip(), words))
+    if not sentences:
+        return ""
+
+    frequencies = {}
+    for _, words in sentences:
+        for word in words:
+            if word not in SUMMARY_STOPWORDS and len(word) > 2:
+                frequencies[word] = frequencies.get(word, 0) + 1
+    if not frequencies:
+        return ""
+    top_frequency = max(frequencies.values())
+
+    scored = []
+    for index, (sentence, words) in enumerate(sentences):
+        score = sum(frequencies.get(word, 0) for word in words) / (top_frequency * len(words))
+        scored.append((score, index, sentence, set(words)))
+    scored.sort(key=lambda entry: (-entry[0], entry[1]))
+
+    chosen = []
+    for score, index, sentence, words in scored:
+        # Skip sentences that mostly repeat one that was already picked.
+        if any(len(words & other) / len(words | other) > 0.5 for _, _, other in chosen):
+            continue
+        chosen.append((index, sentence, words))
+        if len(chosen) == max_sentences:
+            break
+    chosen.sort()
+
+    ratings = [r.get("rating") for r in reviews if isinstance(r.get("rating"), (int, float))]
+    keywords = sorted(frequencies, key=lambda word: (-frequencies[word], word))[:5]
+    lines = []
+    if ratings:
+        lines.append(f"Average rating {sum(ratings) / len(ratings):.1f} from {len(ratings)} reviews.")
+    lines.append("Frequently mentioned: " + ", ".join(keywords) + ".")
+    lines.append("")
+    lines.extend(f"• {sentence}" for _, sentence, _ in chosen)
+    return "\n".join(lines)
+
+
+def summarizeBatch(jobs):
+    # Runs in a worker process; jobs is a list of (key, place_id, reviews).
+    return [(key, place_id, summarizeReviews(reviews)) for key, place_id, reviews in jobs]
+
+
+def loadSummaryCache():
+    try:
+        with open(SUMMARY_CACHE_FILE, "r") as f:
+            summary_cache.update(json.load(f))
+    except Exception:
+        pass
+
+
+summary_cache_lock = threading.Lock()
+
+
+def writeSummaryCache(snapshot):
+    # Write to a temp file and rename it into place so a crash never leaves truncated JSON.
+    with summary_cache_lock:
+        try:
+            directory = os.path.dirname(os.path.abspath(SUMMARY_CACHE_FILE))
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                f.write(snapshot)
+            os.replace(tmp_path, SUMMARY_CACHE_FILE)
+        except OSError as e:
+            print("Error saving summary cache:", e)
+
+
+def storeSummary(key, summary):
+    # One summary per place: a new review hash replaces the place's previous entry.
+    place_prefix = key.rsplit(":", 1)[0] + ":"
+    for stale in [k for k in summary_cache if k.startswith(place_prefix) and k != key]:
+        del summary_cache[stale]
+    summary_cache.pop(key, None)
+    summary_cache[key] = summary
+    while len(summary_cache) > SUMMARY_CACHE_MAX_ENTRIES:
+        del summary_cache[next(iter(summary_cache))]
+
+
+class ReviewSummarizer(QObject):
+    summary_ready = Signal(str, str)  # place_id, summary
+    summary_failed = Signal(str)      # place_id
+    batch_finished = Signal(list)     # Delivered from the executor thread to the GUI thread
+    pool_failed = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.executor = None
+        self.pending = set()  # Summary keys already submitted to the pool
+        self.batch_finished.connect(self.onBatchFinished)
+        self.pool_failed.connect(self.resetExecutor)
+        # Coalesce saves so a burst of batches rewrites the file once, off the GUI thread.
+        self.saveTimer = QTimer(self)
+        self.saveTimer.setSingleShot(True)
+        self.saveTimer.setInterval(1000)
+        self.saveTimer.timeout.connect(self.saveInBackground)
+        loadSummaryCache()
+
+    def cachedSummary(self, place_id, reviews):
+        key = summaryKey(place_id, reviews)
+        summary = summary_cache.get(key)
+        if summary is not None:
+            # Refresh its position so the size cap drops the least recently used summaries.
+            summary_cache[key] = summary_cache.pop(key)
+        return summary
+
+    def summarize(self, place_id, reviews):
+        self.summarizeMany([{"place_id": place_id, "reviews": reviews}])
+
+    def summarizeMany(self, places):
+        # Submit every place that has reviews but no memoized summary as a single pool job.
+        jobs = []
+        for place in places:
+            place_id = place.get("place_id")
+            reviews = place.get("reviews") or []
+            if not place_id or not reviews:
+                continue
+            key = summaryKey(place_id, reviews)
+            if key in summary_cache or key in self.pending:
+                continue
+            self.pending.add(key)
+            jobs.append((key, place_id, reviews))
+        if not jobs:
+            return
+        try:
+            if self.executor is None:
+                # Spawn rather than fork: forking would copy the Qt and asyncio threads' state.
+                self.executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+            future = self.executor.submit(summarizeBatch, jobs)
+        except (BrokenProcessPool, RuntimeError, OSError) as e:
+            # Start a fresh pool next time rather than wedging every later request.
+            print("Error starting review summarizer:", e)
+            self.resetExecutor()
+            self.onBatchFinished([(key, place_id, None) for key, place_id, _ in jobs])
+            return
+        future.add_done_callback(lambda f, jobs=jobs: self.onFutureDone(f, jobs))
+
+    def onFutureDone(self, future, jobs):
+        # Called on an executor thread, so hand the results back through a queued signal.
+        if future.cancelled():
+            return
+        try:
+            self.batch_finished.emit(future.result())
+        except Exception as e:
+            print("Error summarizing reviews:", e)
+            if isinstance(e, BrokenProcessPool):
+                self.pool_failed.emit()
+            self.batch_finished.emit([(key, place_id, None) for key, place_id, _ in jobs])
+
+    def onBatchFinished(self, results):
+        updated = False
+        for key, place_id, summary in results:
+            self.pending.discard(key)
+            if summary is None:
+                self.summary_failed.emit(place_id)
+                continue
+            storeSummary(key, summary)
+            updated = True
+            self.summary_ready.emit(place_id, summary)
+        if updated:
+            self.saveTimer.start()
+
+    def saveInBackground(self):
+        snapshot = json.dumps(summary_cache)
+        threading.Thread(target=writeSummaryCache, args=(snapshot,), daemon=True).start()
+
+    def resetExecutor(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def shutdown(self):
+        if self.saveTimer.isActive():
+            self.saveTimer.stop()
+            writeSummaryCache(json.dumps(summary_cache))
+        self.resetExecutor()
+
+# -----------------------------
+# Photo Caching and Loading (On-disk cache + off-thread decode)
+# -----------------------------
+class PhotoDiskCache:
+    # Encoded photo bytes on disk, one file per (photo_reference, max_width) named by its
+    # SHA-256. File mtimes double as the LRU clock so the index survives restarts.
+    def __init__(self, directory=PHOTO_CACHE_DIR, max_bytes=PHOTO_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # { filename : size }, least recently used first
+        self.total_bytes = 0
+        self.indexed = False          # Until loadIndex() finishes, files on disk may be missing from entries
+
+    def loadIndex(self):
+        # Scans the directory, so run it off the GUI thread; get() and put() work meanwhile.
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            found = []
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if not entry.is_file():
+                        continue
+                    if entry.name.endswith(".tmp"):
+                        # Left behind by a write that never completed.
+                        os.remove(entry.path)
+                        continue
+                    info = entry.stat()
+                    found.append((info.st_mtime, entry.name, info.st_size))
+        except OSError as e:
+            print("Error indexing photo cache:", e)
+            return
+        with self.lock:
+            # Photos read or written during the scan are already indexed as most recent.
+            for _, name, size in sorted(found, reverse=True):
+                if name not in self.entries:
+                    self.entries[name] = size
+                    self.entries.move_to_end(name, last=False)
+                    self.total_bytes += size
+            self.indexed = True
+            self.evict()
+
+    def filename(self, photo_reference, max_width):
+        return hashlib.sha256(f"{photo_reference}:{max_width}".encode("utf-8")).hexdigest()
+
+    def get(self, photo_reference, max_width):
+        name = self.filename(photo_reference, max_width)
+        path = os.path.join(self.directory, name)
+        with self.lock:
+            if name not in self.entries and self.indexed:
+                return None
+        # Read outside the lock so one slow disk read doesn't stall every other lookup.
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            with self.lock:
+                if name in self.entries:
+                    self.total_bytes -= self.entries.pop(name)
+            return None
+        with self.lock:
+            if name in self.entries:
+                self.entries.move_to_end(name)
+            elif not self.indexed:
+                self.entries[name] = len(data)
+                self.total_bytes += len(data)
+        return data
+
+    def put(self, photo_reference, max_width, data):
+        name = self.filename(photo_reference, max_width)
+        path = os.path.join(self.directory, name)
+        try:
+            # Write to a temp file in the same directory and rename it into place so
+            # readers never see a partially written photo.
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print("Error writing photo cache:", e)
+            return
+        with self.lock:
+            self.total_bytes -= self.entries.pop(name, 0)
+            self.entries[name] = len(data)
+            self.total_bytes += len(data)
+            self.evict()
+
+    def evict(self):
+        # Caller holds self.lock.
+        while self.total_bytes > self.max_bytes and self.entries:
+            name, size = self.entries.popitem(last=False)
+            self.total_bytes -= size
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+
+def decodeImage(data):
+    # QImage (unlike QPixmap) may be decoded off the GUI thread.
+    image = QImage()
+    image.loadFromData(data)
+    return image
+
+
+class PhotoLoader(QObject):
+    photo_ready = Signal(str, int, QPixmap)
+
+    def __init__(self, engine, disk_cache, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.disk_cache = disk_cache
+        self.engine.submit(self.engine.runBlocking(self.disk_cache.loadIndex))
+        self.pending = set()  # { (photo_reference, max_width) } currently being loaded
+        self.groups = {}      # { group : { (photo_reference, max_width) : Future } }, cancellable together
+
+    def request(self, photo_reference, max_width, group):
+        key = (photo_reference, max_width)
+        if key in self.pending:
+            return
+        self.pending.add(key)
+        future = self.engine.submit(self.loadPhoto(photo_reference, max_width), on_result=self.onPhotoLoaded)
+        self.groups.setdefault(group, {})[key] = future
+
+    def cancelGroup(self, group):
+        # Drops downloads the UI no longer needs (e.g. thumbnails of a superseded search)
+        # so they stop competing for connections and Photo API calls.
+        for key, future in self.groups.pop(group, {}).items():
+            if future.cancel():
+                self.pending.discard(key)
+
+    async def loadPhoto(self, photo_reference, max_width):
+        image = QImage()
+        try:
+            data = await self.engine.runBlocking(self.disk_cache.get, photo_reference, max_width)
+            if data is None:
+                encoded = await self.engine.cached(
+                    "photos", f"{photo_reference}:{max_width}", PHOTO_SHARED_TTL,
+                    lambda: self.downloadPhoto(photo_reference, max_width)
+                )
+                data = base64.b64decode(encoded)
+                await self.engine.runBlocking(self.disk_cache.put, photo_reference, max_width, data)
+            image = await self.engine.runBlocking(decodeImage, data)
+        except Exception as e:
+            print("Error downloading image:", e)
+        return photo_reference, max_width, image
+
+    async def downloadPhoto(self, photo_reference, max_width):
+        # Base64 so the bytes can travel through the shared cache's JSON protocol.
+        url = "https://maps.googleapis.com/maps/api/place/photo"
+        params = {"maxwidth": max_width, "photoreference": photo_reference, "key": GOOGLE_PLACES_API_KEY}
+        status_code, data = await self.engine.getBytes(url, params)
+        if data is None:
+            raise Exception(f"Photo API error: HTTP {status_code}")
+        return base64.b64encode(data).decode("ascii")
+
+    def onPhotoLoaded(self, result):
+        photo_reference, max_width, image = result
+        self.pending.discard((photo_reference, max_width))
+        for futures in self.groups.values():
+            futures.pop((photo_reference, max_width), None)
+        if image.isNull():
+            return
+        pixmap = QPixmap.fromImage(image)
+        image_cache[(photo_reference, max_width)] = pixmap
+        self.photo_ready.emit(photo_reference, max_width, pixmap)
+
+# -----------------------------
+# Map View (Quadtree-clustered markers on a plain canvas)
+# -----------------------------
+class QuadTreeNode:
+    # Square region of the map plane (meters east/south of the search center). Every node
+    # keeps the count and coordinate sums of the places below it, so a subtree can be drawn
+    # as one cluster without visiting its leaves.
+    CAPACITY = 8
+    MAX_DEPTH = 20
+
+    __slots__ = ("x0", "y0", "size", "depth", "points", "children", "count", "sum_x", "sum_y")
+
+    def __init__(self, x0, y0, size, depth=0):
+        self.x0 = x0
+        self.y0 = y0
+        self.size = size
+        self.depth = depth
+        self.points = []  # [(x, y, place), ...] while this node is a leaf
+        self.children = None
+        self.count = 0
+        self.sum_x = 0.0
+        self.sum_y = 0.0
+
+    def insert(self, x, y, place):
+        self.count += 1
+        self.sum_x += x
+        self.sum_y += y
+        if self.children is None:
+            self.points.append((x, y, place))
+            if len(self.points) > self.CAPACITY and self.depth < self.MAX_DEPTH:
+                self.split()
+            return
+        self.childFor(x, y).insert(x, y, place)
+
+    def split(self):
+        half = self.size / 2
+        self.children = [
+            QuadTreeNode(self.x0 + dx * half, self.y0 + dy * half, half, self.depth + 1)
+            for dy in (0, 1) for dx in (0, 1)
+        ]
+        points, self.points = self.points, []
+        for x, y, place in points:
+            self.childFor(x, y).insert(x, y, place)
+
+    def childFor(self, x, y):
+        half = self.size / 2
+        col = 1 if x >= self.x0 + half else 0
+        row = 1 if y >= self.y0 + half else 0
+        return self.children[row * 2 + col]
+
+    def intersects(self, left, top, right, bottom):
+        return not (self.x0 > right or self.x0 + self.size < left or self.y0 > bottom or self.y0 + self.size < top)
+
+    def collect(self, left, top, right, bottom, min_cluster_size, out):
+        # Appends (x, y, count, place) for the viewport. Nodes smaller than min_cluster_size
+        # collapse to one cluster at their centroid; single places carry their dict.
+        if self.count == 0 or not self.intersects(left, top, right, bottom):
+            return
+        if self.count > 1 and self.size <= min_cluster_size:
+            out.append((self.sum_x / self.count, self.sum_y / self.count, self.count, None))
+            return
+        if self.children is None:
+            for x, y, place in self.points:
+                if left <= x <= right and top <= y <= bottom:
+                    out.append((x, y, 1, place))
+            return
+        for child in self.children:
+            child.collect(left, top, right, bottom, min_cluster_size, out)
+
+
+class MapView(QWidget):
+    placeClicked = Signal(dict)
+
+    CLUSTER_PIXELS = 48     # Places closer than roughly this on screen are drawn as one cluster
+    MARKER_RADIUS = 7
+    MIN_SCALE = 0.0005      # Pixels per meter
+    MAX_SCALE = 20.0
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumHeight(250)
+        self.setMouseTracking(False)
+        self.dark_mode = False
+        self.center = None       # (lat, lon) of the search, drawn at plane origin
+        self.tree = None
+        self.extent = 0.0        # Half-width of the plane area holding every place
+        self.pendingFit = False  # Fit once the widget has its real size
+        self.scale = 0.05        # Pixels per meter
+        self.view_x = 0.0        # Plane coordinates shown at the widget center
+        self.view_y = 0.0
+        self.drawn = []          # Markers from the last paint, for hit testing
+        self.dragStart = None
+        self.dragMoved = False
+
+    def project(self, lat, lon):
+        # Equirectangular projection around the search center; accurate at city scale.
+        lat0, lon0 = self.center
+        x = (lon - lon0) * 111320.0 * math.cos(math.radians(lat0))
+        y = (lat0 - lat) * 110540.0
+        return x, y
+
+    def setPlaces(self, places, center=None, fit=True):
+        if center is not None:
+            self.center = center
+        located = []
+        for place in places:
+            location = place.get("geometry", {}).get("location", {})
+            if "lat" in location and "lng" in location:
+                located.append((location["lat"], location["lng"], place))
+        if self.center is None and located:
+            self.center = (
+                sum(lat for lat, _, _ in located) / len(located),
+                sum(lon for _, lon, _ in located) / len(located),
+            )
+        if self.center is None:
+            self.tree = None
+            self.update()
+            return
+
+        projected = [self.project(lat, lon) + (place,) for lat, lon, place in located]
+        self.extent = max([abs(v) for x, y, _ in projected for v in (x, y)] + [100.0])
+        self.tree = QuadTreeNode(-self.extent * 1.01, -self.extent * 1.01, self.extent * 2.02)
+        for x, y, place in projected:
+            self.tree.insert(x, y, place)
+
+        if fit:
+            if self.isVisible():
+                self.fitToPlaces()
+            else:
+                self.pendingFit = True
+        self.update()
+
+    def fitToPlaces(self):
+        self.pendingFit = False
+        self.view_x = 0.0
+        self.view_y = 0.0
+        span = 2 * self.extent * 1.1
+        self.scale = max(self.MIN_SCALE, min(self.MAX_SCALE, min(self.width(), self.height()) / span))
+        self.update()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.pendingFit:
+            self.fitToPlaces()
+
+    def setDarkMode(self, enabled: bool):
+        self.dark_mode = enabled
+        self.update()
+
+    def toScreen(self, x, y):
+        return QPointF(
+            self.width() / 2 + (x - self.view_x) * self.scale,
+            self.height() / 2 + (y - self.view_y) * self.scale,
+        )
+
+    def markerRadius(self, count):
+        if count == 1:
+            return self.MARKER_RADIUS
+        # Capped so clusters at least CLUSTER_PIXELS apart can never overlap.
+        return min(self.CLUSTER_PIXELS / 2 - 1, self.MARKER_RADIUS + 3 * math.log2(count))
+
+    def visibleMarkers(self):
+        # Quadtree nodes collapse to clusters first; the survivors are then merged on screen
+        # so every marker kept is at least CLUSTER_PIXELS from the others, and markers whose
+        # circle misses the widget are dropped. Returns [(point, radius, x, y, count, place)].
+        half_w = self.width() / 2 / self.scale
+        half_h = self.height() / 2 / self.scale
+        margin = (self.CLUSTER_PIXELS / 2) / self.scale
+        candidates = []
+        self.tree.collect(
+            self.view_x - half_w - margin, self.view_y - half_h - margin,
+            self.view_x + half_w + margin, self.view_y + half_h + margin,
+            self.CLUSTER_PIXELS / self.scale, candidates
+        )
+        candidates.sort(key=lambda marker: -marker[2])
+
+        cell = self.CLUSTER_PIXELS
+        grid = {}
+        merged = []  # [screen_x, screen_y, sum_x, sum_y, count, place]
+        for x, y, count, place in candidates:
+            sx = self.width() / 2 + (x - self.view_x) * self.scale
+            sy = self.height() / 2 + (y - self.view_y) * self.scale
+            col, row = int(sx // cell), int(sy // cell)
+            target = None
+            for dc in (-1, 0, 1):
+                for dr in (-1, 0, 1):
+                    for marker in grid.get((col + dc, row + dr), ()):
+                        if (marker[0] - sx) ** 2 + (marker[1] - sy) ** 2 < cell * cell:
+                            target = marker
+                            break
+                    if target:
+                        break
+                if target:
+                    break
+            if target is None:
+                marker = [sx, sy, x * count, y * count, count, place]
+                merged.append(marker)
+                grid.setdefault((col, row), []).append(marker)
+            else:
+                # Absorbed markers add to the count; the anchor keeps its spot so spacing holds.
+                target[2] += x * count
+                target[3] += y * count
+                target[4] += count
+                target[5] = None
+
+        width, height = self.width(), self.height()
+        markers = []
+        for sx, sy, sum_x, sum_y, count, place in merged:
+            radius = self.markerRadius(count)
+            if sx + radius < 0 or sx - radius > width or sy + radius < 0 or sy - radius > height:
+                continue
+            markers.append((QPointF(sx, sy), radius, sum_x / count, sum_y / count, count, place))
+        return markers
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), QColor("#23272A") if self.dark_mode else QColor("#FFFFFF"))
+        self.drawn = []
+        if self.tree is None:
+            painter.setPen(QColor("#DCDDDE") if self.dark_mode else QColor("#1c1e21"))
+            painter.drawText(self.rect(), Qt.AlignCenter, "Search to see restaurants on the map.")
+            return
+
+        self.drawn = self.visibleMarkers()
+
+        origin = self.toScreen(0.0, 0.0)
+        painter.setPen(QPen(QColor("#E0245E"), 2))
+        painter.drawLine(origin + QPointF(-8, 0), origin + QPointF(8, 0))
+        painter.drawLine(origin + QPointF(0, -8), origin + QPointF(0, 8))
+
+        # Draw by style so the pen and brush change twice per frame rather than per marker.
+        accent = QColor("#7289DA") if self.dark_mode else QColor("#1877F2")
+        painter.setPen(QPen(accent, 2))
+        painter.setBrush(QColor(accent.red(), accent.green(), accent.blue(), 90))
+        for point, radius, x, y, count, place in self.drawn:
+            if count > 1:
+                painter.drawEllipse(point, radius, radius)
+        painter.setPen(QPen(QColor("white"), 2))
+        painter.setBrush(accent)
+        for point, radius, x, y, count, place in self.drawn:
+            if count == 1:
+                painter.drawEllipse(point, radius, radius)
+
+        painter.setPen(QColor("#DCDDDE") if self.dark_mode else QColor("#1c1e21"))
+        painter.setFont(QFont("Segoe UI", 9, QFont.Bold))
+        for point, radius, x, y, count, place in self.drawn:
+            if count > 1:
+                painter.drawText(QRectF(point.x() - radius, point.y() - radius, 2 * radius, 2 * radius),
+                                 Qt.AlignCenter, str(count))
+
+    def markerAt(self, pos):
+        for point, radius, x, y, count, place in reversed(self.drawn):
+            if (point.x() - pos.x()) ** 2 + (point.y() - pos.y()) ** 2 <= radius ** 2:
+                return x, y, count, place
+        return None
+
+    def zoomAround(self, pos, factor):
+        new_scale = max(self.MIN_SCALE, min(self.MAX_SCALE, self.scale * factor))
+        # Keep the plane point under the cursor fixed while zooming.
+        px = self.view_x + (pos.x() - self.width() / 2) / self.scale
+        py = self.view_y + (pos.y() - self.height() / 2) / self.scale
+        self.view_x = px - (pos.x() - self.width() / 2) / new_scale
+        self.view_y = py - (pos.y() - self.height() / 2) / new_scale
+        self.scale = new_scale
+        self.update()
+
+    def wheelEvent(self, event):
+        steps = event.angleDelta().y() / 120
+        if steps:
+            self.zoomAround(event.position(), 1.25 ** steps)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.dragStart = event.position()
+            self.dragMoved = False
+
+    def mouseMoveEvent(self, event):
+        if self.dragStart is None:
+            return
+        delta = event.position() - self.dragStart
+        if not self.dragMoved and abs(delta.x()) + abs(delta.y()) < 4:
+            return
+        self.dragMoved = True
+        self.view_x -= delta.x() / self.scale
+        self.view_y -= delta.y() / self.scale
+        self.dragStart = event.position()
+        self.update()
+
+    def mouseReleaseEvent(self, event):
+        if event.button() != Qt.LeftButton or self.dragStart is None:
+            return
+        self.dragStart = None
+        if self.dragMoved:
+            return
+        hit = self.markerAt(event.position())
+        if hit is None:
+            return
+        x, y, count, place = hit
+        if place is not None:
+            self.placeClicked.emit(place)
+        else:
+            # Zoom into the cluster until it splits apart.
+            self.view_x = x
+            self.view_y = y
+            self.zoomAround(QPointF(self.width() / 2, self.height() / 2), 2.0)
+
+# -----------------------------
+# LocationService (Background "Near Me" lookup)
+# -----------------------------
+def lookupIpLocation():
+    g = geocoder.ip('me', timeout=IP_LOOKUP_TIMEOUT)
+    if g.ok and g.latlng:
+        lat, lon = g.latlng
+        return float(lat), float(lon)
+    raise Exception("Unable to determine your location.")
+
+
+# Resolves the IP-based location off the GUI thread and caches it for IP_LOCATION_TTL seconds.
+# The lookup runs on the NetworkEngine so closing the window mid-lookup never tears down a live thread.
+class LocationService(QObject):
+    location_ready = Signal(float, float)
+    location_failed = Signal(str)
+
+    def __init__(self, engine, ttl=IP_LOCATION_TTL, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.ttl = ttl
+        self.future = None
+
+    def cachedLocation(self):
+        entry = ip_location_cache.get("me")
+        if entry:
+            latlng, fetched_at = entry
+            if time.time() - fetched_at < self.ttl:
+                return latlng
+        return None
+
+    def isPending(self):
+        return self.future is not None
+
+    def prewarm(self):
+        # Start a lookup unless a fresh location is cached or one is already in flight.
+        if self.cachedLocation() is not None or self.isPending():
+            return
+        self.future = self.engine.submit(
+            self.engine.runBlocking(lookupIpLocation),
+            on_result=self.onLocationReady,
+            on_error=self.onLocationError
+        )
+
+    def onLocationReady(self, latlng):
+        self.future = None
+        lat, lon = latlng
+        ip_location_cache["me"] = ((lat, lon), time.time())
+        self.location_ready.emit(lat, lon)
+
+    def onLocationError(self, error_msg):
+        self.future = None
+        self.location_failed.emit(error_msg)
 
 # -----------------------------
 # WelcomePage (Landing Page)
@@ -151,10 +1364,12 @@ class WelcomePage(QWidget):
     searchInitiated = Signal(str)
     darkModeToggled = Signal(bool)
 
-    def __init__(self, parent=None):
+    def __init__(self, location_service, parent=None):
         super().__init__(parent)
         self.loadingDots = 0
         self.loadingTimer = None
+        self.location_service = location_service
+        self.awaitingLocation = False
 
         layout = QVBoxLayout()
         layout.addStretch()
@@ -224,6 +1439,8 @@ class WelcomePage(QWidget):
         self.search_button.clicked.connect(self.onSearchClicked)
         self.findNearMeButton.clicked.connect(self.onFindNearMeClicked)
         self.darkModeCheckBox.toggled.connect(lambda checked: self.darkModeToggled.emit(checked))
+        self.location_service.location_ready.connect(self.onLocationResolved)
+        self.location_service.location_failed.connect(self.onLocationFailed)
 
     def onSearchClicked(self):
         self.animateButtonClick(self.search_button)
@@ -238,14 +1455,26 @@ class WelcomePage(QWidget):
     def onFindNearMeClicked(self):
         self.animateButtonClick(self.findNearMeButton)
         self.startLoadingAnimation()
-        g = geocoder.ip('me')
-        if g.ok and g.latlng:
-            lat, lon = g.latlng
-            location_str = f"{lat}, {lon}"
-            self.searchInitiated.emit(location_str)
-        else:
-            QMessageBox.warning(self, "Location Error", "Unable to determine your location.")
-            self.stopLoadingAnimation()
+        location = self.location_service.cachedLocation()
+        if location:
+            self.searchInitiated.emit(f"{location[0]}, {location[1]}")
+            return
+        # Chain onto the pending (or a fresh) lookup; the search starts once it resolves.
+        self.awaitingLocation = True
+        self.location_service.prewarm()
+
+    def onLocationResolved(self, lat, lon):
+        if not self.awaitingLocation:
+            return
+        self.awaitingLocation = False
+        self.searchInitiated.emit(f"{lat}, {lon}")
+
+    def onLocationFailed(self, error_msg):
+        if not self.awaitingLocation:
+            return
+        self.awaitingLocation = False
+        QMessageBox.warning(self, "Location Error", "Unable to determine your location.")
+        self.stopLoadingAnimation()
 
     def animateButtonClick(self, button):
         effect = QGraphicsOpacityEffect(button)
@@ -287,13 +1516,17 @@ class WelcomePage(QWidget):
 class UpdatedSearchPage(QWidget):
     searchInitiated = Signal(str)
 
-    def __init__(self, parent=None):
+    def __init__(self, engine, parent=None):
         super().__init__(parent)
+        self.engine = engine
+        self.detailsFuture = None    # In-flight details request, cancelled when another place is opened
+        self.detailsGeneration = 0   # Bumped per opened place; callbacks from older requests are ignored
         self.dark_mode = False
         self.photoReferences = []
         self.originalPixmaps = []
         self.currentPhotoIndex = 0
         self.all_restaurants = []  # Full search results
+        self.filters_applied = False  # Whether the list currently reflects the filter panel
         self.favorites = []        # List of favorited restaurant dicts
 
         main_layout = QVBoxLayout(self)
@@ -355,14 +1588,27 @@ class UpdatedSearchPage(QWidget):
         search_tab_layout.addWidget(self.restaurant_list)
         left_tab_widget.addTab(search_tab, "Search Results")
 
+        # Map Tab
+        self.map_view = MapView()
+        self.map_view.placeClicked.connect(self.onMapPlaceClicked)
+        left_tab_widget.addTab(self.map_view, "Map")
+
         # Favorites Tab
         favorites_tab = QWidget()
         favorites_layout = QVBoxLayout(favorites_tab)
         self.favorites_list = QListWidget()
         favorites_layout.addWidget(self.favorites_list)
         left_tab_widget.addTab(favorites_tab, "Favorites")
+        self.photo_loader = PhotoLoader(self.engine, PhotoDiskCache(), self)
+        self.photo_loader.photo_ready.connect(self.onPhotoReady)
+        self.summarizer = ReviewSummarizer(self)
+        self.summarizer.summary_ready.connect(self.onSummaryReady)
+        self.summarizer.summary_failed.connect(self.onSummaryFailed)
+        self.summaryPrefetch = None  # In-flight details prefetch for the top search results
         self.loadFavorites()
         self.favorites_list.itemClicked.connect(self.onFavoriteClicked)
+        # Summarize favorites up front so their summaries are ready when opened.
+        self.summarizer.summarizeMany(self.favorites)
 
         # --- Main Splitter (Left Panel + Details) ---
         splitter = QSplitter(Qt.Horizontal)
@@ -375,9 +1621,10 @@ class UpdatedSearchPage(QWidget):
         details_layout.setAlignment(Qt.AlignTop)
         name_container = QWidget()
         name_layout = QVBoxLayout(name_container)
-        self.details_name_label = QLabel("<b>Name:</b>")
+        self.details_name_label = QLabel("Name:")
         self.details_name_label.setAlignment(Qt.AlignCenter)
         self.details_name_label.setFont(QFont("Segoe UI", 28, QFont.Bold))
+        self.details_name_label.setTextFormat(Qt.PlainText)
         name_layout.addWidget(self.details_name_label)
         details_layout.addWidget(name_container)
         # Image Gallery
@@ -416,6 +1663,8 @@ class UpdatedSearchPage(QWidget):
         self.ratingBubble = QLabel()
         self.websiteBubble = QLabel()
         self.priceBubble = QLabel()
+        for bubble in [self.phoneBubble, self.ratingBubble, self.priceBubble]:
+            bubble.setTextFormat(Qt.PlainText)
         self.setBubbleStyles(self.dark_mode)
         bubbleLayout.addWidget(self.phoneBubble)
         bubbleLayout.addWidget(self.ratingBubble)
@@ -513,47 +1762,104 @@ class UpdatedSearchPage(QWidget):
     def onFavoriteClicked(self, item: QListWidgetItem):
         restaurant = item.data(Qt.UserRole)
         if restaurant:
+            # Favorites carry their details, but a list or map click still in flight must not replace them.
+            self.beginDetails()
             self.showRestaurantDetails(restaurant)
 
-    def applyFilters(self):
+    def matchesFilters(self, rest):
         selected_cuisine = self.cuisine_combo.currentText()
         selected_price = self.price_combo.currentText()
         open_now = self.open_now_checkbox.isChecked()
 
-        filtered = []
-        for rest in self.all_restaurants:
-            if selected_price != "All":
-                mapping = {"$": 1, "$$": 2, "$$$": 3, "$$$$": 4}
-                if rest.get("price_level", 0) != mapping.get(selected_price, 0):
-                    continue
-            if open_now:
-                if not rest.get("opening_hours", {}).get("open_now", False):
-                    continue
-            if selected_cuisine != "All":
-                types = rest.get("types", [])
-                # Check for exact match ignoring case.
-                if selected_cuisine.lower() not in [t.lower() for t in types]:
-                    continue
-            filtered.append(rest)
+        if selected_price != "All":
+            mapping = {"$": 1, "$$": 2, "$$$": 3, "$$$$": 4}
+            if rest.get("price_level", 0) != mapping.get(selected_price, 0):
+                return False
+        if open_now:
+            if not rest.get("opening_hours", {}).get("open_now", False):
+                return False
+        if selected_cuisine != "All":
+            types = rest.get("types", [])
+            # Check for exact match ignoring case.
+            if selected_cuisine.lower() not in [t.lower() for t in types]:
+                return False
+        return True
+
+    def createRestaurantItem(self, rest):
+        item = QListWidgetItem()
+        self.updateRestaurantItem(item, rest)
+        if "photos" in rest and rest["photos"]:
+            photo_ref = rest["photos"][0].get("photo_reference")
+            pixmap = self.get_photo_pixmap(photo_ref, max_width=100, group="thumbnails")
+            if pixmap:
+                item.setIcon(QIcon(pixmap))
+        return item
+
+    def updateRestaurantItem(self, item, rest):
+        name = rest.get("name", "Unnamed")
+        vicinity = rest.get("vicinity", "No address")
+        item.setText(f"{name}\n{vicinity}")
+        item.setData(Qt.UserRole, rest)
+
+    def shownRestaurants(self):
+        # The places the list and the map should both show for the current filter state.
+        if not self.filters_applied:
+            return list(self.all_restaurants)
+        return [rest for rest in self.all_restaurants if self.matchesFilters(rest)]
 
+    def applyFilters(self):
+        self.filters_applied = True
+        shown = self.shownRestaurants()
+        self.map_view.setPlaces(shown, fit=False)
         self.restaurant_list.clear()
-        for rest in filtered:
-            name = rest.get("name", "Unnamed")
-            vicinity = rest.get("vicinity", "No address")
-            item_text = f"{name}\n{vicinity}"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, rest)
-            if "photos" in rest and rest["photos"]:
-                photo_ref = rest["photos"][0].get("photo_reference")
-                pixmap = self.get_photo_pixmap(photo_ref, max_width=100)
-                if pixmap:
-                    item.setIcon(QIcon(pixmap))
-            self.restaurant_list.addItem(item)
+        for rest in shown:
+            self.restaurant_list.addItem(self.createRestaurantItem(rest))
         if self.restaurant_list.count() > 0:
             first_item = self.restaurant_list.item(0)
             self.restaurant_list.setCurrentItem(first_item)
             self.onRestaurantClicked(first_item)
 
+    def patchRestaurantList(self, results):
+        # Apply a background refresh row by row so the selection and scroll position survive.
+        self.all_restaurants = results
+        shown = self.shownRestaurants()
+        self.map_view.setPlaces(shown, fit=False)
+        fresh = {}
+        for rest in shown:
+            if rest.get("place_id"):
+                fresh[rest["place_id"]] = rest
+
+        current = self.restaurant_list.currentItem()
+        scroll_value = self.restaurant_list.verticalScrollBar().value()
+
+        # Drop rows for places that vanished (or duplicates), keeping the rest keyed by place_id.
+        existing = {}
+        row = 0
+        while row < self.restaurant_list.count():
+            item = self.restaurant_list.item(row)
+            place_id = (item.data(Qt.UserRole) or {}).get("place_id")
+            if place_id not in fresh or place_id in existing:
+                self.restaurant_list.takeItem(row)
+                continue
+            existing[place_id] = item
+            row += 1
+
+        # Walk the refreshed results in API order, moving or inserting only rows that are out of place.
+        for row, (place_id, rest) in enumerate(fresh.items()):
+            item = existing.get(place_id)
+            if item is None:
+                self.restaurant_list.insertItem(row, self.createRestaurantItem(rest))
+                continue
+            current_row = self.restaurant_list.row(item)
+            if current_row != row:
+                self.restaurant_list.insertItem(row, self.restaurant_list.takeItem(current_row))
+            if restaurantChanged(item.data(Qt.UserRole) or {}, rest):
+                self.updateRestaurantItem(item, rest)
+
+        if current is not None and current.listWidget() is self.restaurant_list:
+            self.restaurant_list.setCurrentItem(current)
+        self.restaurant_list.verticalScrollBar().setValue(scroll_value)
+
     def onSearchClicked(self):
         location = self.location_input.text().strip()
         if not location:
@@ -572,43 +1878,92 @@ class UpdatedSearchPage(QWidget):
         self.onRestaurantClicked(item)
 
     def onRestaurantClicked(self, item: QListWidgetItem):
-        restaurant = item.data(Qt.UserRole)
+        self.openRestaurant(item.data(Qt.UserRole))
+
+    def onMapPlaceClicked(self, restaurant):
+        for row in range(self.restaurant_list.count()):
+            item = self.restaurant_list.item(row)
+            if (item.data(Qt.UserRole) or {}).get("place_id") == restaurant.get("place_id"):
+                self.restaurant_list.setCurrentItem(item)
+                break
+        self.openRestaurant(restaurant)
+
+    def openRestaurant(self, restaurant):
         place_id = restaurant.get("place_id")
         if place_id:
-            try:
-                details = self.fetchRestaurantDetails(place_id)
-                self.showRestaurantDetails(details)
-            except Exception as e:
-                QMessageBox.critical(self, "Details Error", str(e))
+            generation = self.beginDetails()
+            self.detailsFuture = self.engine.submit(
+                self.fetchRestaurantDetails(place_id),
+                on_result=lambda details, generation=generation: self.onDetailsReady(generation, details),
+                on_error=lambda error_msg, generation=generation: self.onDetailsError(generation, error_msg)
+            )
+
+    def beginDetails(self):
+        # Cancel the previous place's details request and gallery downloads before showing another.
+        if self.detailsFuture is not None:
+            self.detailsFuture.cancel()
+            self.detailsFuture = None
+        self.photo_loader.cancelGroup("gallery")
+        self.detailsGeneration += 1
+        return self.detailsGeneration
+
+    def onDetailsReady(self, generation, details):
+        # A result or error can still land just after a newer request cancelled it. Matching on the
+        # request rather than details["place_id"] also accepts the refreshed ids Google may return.
+        if generation != self.detailsGeneration:
+            return
+        self.detailsFuture = None
+        self.showRestaurantDetails(details)
 
-    def fetchRestaurantDetails(self, place_id):
+    def onDetailsError(self, generation, error_msg):
+        if generation != self.detailsGeneration:
+            return
+        self.detailsFuture = None
+        QMessageBox.critical(self, "Details Error", error_msg)
+
+    async def fetchRestaurantDetails(self, place_id):
+        # Only touched on the engine loop, so prefetched details are reused when the place is opened.
+        entry = details_cache.get(place_id)
+        if entry and time.time() - entry[1] < DETAILS_FRESH_SECONDS:
+            return entry[0]
+        details = await self.engine.cached(
+            "details", place_id, DETAILS_SHARED_TTL,
+            lambda: self.downloadRestaurantDetails(place_id)
+        )
+        details_cache[place_id] = (details, time.time())
+        return details
+
+    async def downloadRestaurantDetails(self, place_id):
         url = "https://maps.googleapis.com/maps/api/place/details/json"
         params = {
             "place_id": place_id,
             "fields": "place_id,name,formatted_address,formatted_phone_number,website,rating,price_level,reviews,photos",
             "key": GOOGLE_PLACES_API_KEY
         }
-        response = requests.get(url, params=params)
-        if response.status_code != 200:
-            raise Exception("Failed to fetch details: HTTP " + str(response.status_code))
-        data = response.json()
+        status_code, data = await self.engine.getJson(url, params)
+        if data is None:
+            raise Exception("Failed to fetch details: HTTP " + str(status_code))
         if data.get("status") != "OK":
             raise Exception("Details API error: " + data.get("status"))
         return data.get("result", {})
 
     def showRestaurantDetails(self, details):
         self.current_details = details
-        self.details_name_label.setText(details.get("name", "N/A"))
-        address = details.get("formatted_address", "N/A")
-        maps_url = f"https://www.google.com/maps/search/?api=1&query={address.replace(' ', '+')}"
-        self.details_address_label.setText(f"<b>Address:</b> <a href='{maps_url}'>{address}</a>")
+        # Details may come from the shared cache: plain-text labels are set to Qt.PlainText and
+        # everything placed in rich text is escaped.
+        self.details_name_label.setText(str(details.get("name", "N/A")))
+        address = str(details.get("formatted_address", "N/A"))
+        maps_url = "https://www.google.com/maps/search/?api=1&query=" + urllib.parse.quote_plus(address)
+        self.details_address_label.setText(
+            f"<b>Address:</b> <a href='{html.escape(maps_url, quote=True)}'>{html.escape(address)}</a>"
+        )
         phone = details.get("formatted_phone_number", "N/A")
         self.phoneBubble.setText(f"📞 {phone}")
         rating = details.get("rating", "N/A")
         self.ratingBubble.setText(f"⭐ {rating}")
-        website = details.get("website", "N/A")
-        if website != "N/A":
-            self.websiteBubble.setText(f'<a href="{website}">🌐 Website</a>')
+        website = str(details.get("website", "N/A"))
+        if urllib.parse.urlparse(website).scheme in ("http", "https"):
+            self.websiteBubble.setText(f'<a href="{html.escape(website, quote=True)}">🌐 Website</a>')
             self.websiteBubble.setTextInteractionFlags(Qt.TextBrowserInteraction)
             self.websiteBubble.setOpenExternalLinks(True)
         else:
@@ -630,7 +1985,8 @@ class UpdatedSearchPage(QWidget):
             self.photoReferences = [photo.get("photo_reference") for photo in photos[:5]]
             self.originalPixmaps = []
             for ref in self.photoReferences:
-                pix = self.get_photo_pixmap(ref, max_width=500)
+                # Photos that are not in memory yet arrive later through onPhotoReady.
+                pix = self.get_photo_pixmap(ref, max_width=500, group="gallery")
                 if pix is None:
                     pix = QPixmap()
                 self.originalPixmaps.append(pix)
@@ -642,17 +1998,61 @@ class UpdatedSearchPage(QWidget):
             self.details_image_label.clear()
 
         reviews = details.get("reviews", [])
-        reviews_html = ""
         if reviews:
+            parts = []
             for review in reviews:
-                author = review.get("author_name", "Anonymous")
-                rev_rating = review.get("rating", "N/A")
-                text = review.get("text", "")
-                reviews_html += f"<p><b>{author}</b> (Rating: {rev_rating})<br>{text}</p><hr>"
+                author = html.escape(str(review.get("author_name", "Anonymous")))
+                rev_rating = html.escape(str(review.get("rating", "N/A")))
+                text = html.escape(review.get("text") or "").replace("\n", "<br>")
+                parts.append(f"<p><b>{author}</b> (Rating: {rev_rating})<br>{text}</p><hr>")
+            reviews_html = "".join(parts)
         else:
             reviews_html = "<p><i>No reviews available.</i></p>"
         self.details_reviews_text.setHtml(reviews_html)
-        self.ai_summary_text.setText("AI Summary not available yet. Feature coming soon!")
+
+        summary = self.summarizer.cachedSummary(details.get("place_id"), reviews) if reviews else None
+        if summary is not None:
+            self.ai_summary_text.setPlainText(summary or "Not enough review text to summarize.")
+        elif reviews and details.get("place_id"):
+            self.ai_summary_text.setPlainText("Summarizing reviews...")
+            self.summarizer.summarize(details["place_id"], reviews)
+        else:
+            self.ai_summary_text.setPlainText("No reviews to summarize.")
+
+    def onSummaryReady(self, place_id, summary):
+        current = getattr(self, "current_details", None)
+        if current and current.get("place_id") == place_id:
+            self.ai_summary_text.setPlainText(summary or "Not enough review text to summarize.")
+
+    def onSummaryFailed(self, place_id):
+        current = getattr(self, "current_details", None)
+        if current and current.get("place_id") == place_id:
+            self.ai_summary_text.setPlainText("Summary unavailable right now.")
+
+    def cancelSummaryPrefetch(self):
+        if self.summaryPrefetch is not None:
+            self.summaryPrefetch.cancel()
+            self.summaryPrefetch = None
+
+    def prefetchSummaries(self, results):
+        # Fetch details for the next few results (the first is opened anyway) and summarize them
+        # in one batch, so their summaries are ready by the time they are clicked.
+        self.cancelSummaryPrefetch()
+        place_ids = [r["place_id"] for r in results[1:SUMMARY_PREFETCH_COUNT + 1] if r.get("place_id")]
+        if not place_ids:
+            self.summaryPrefetch = None
+            return
+        self.summaryPrefetch = self.engine.submit(
+            self.fetchDetailsBatch(place_ids),
+            on_result=self.summarizer.summarizeMany
+        )
+
+    async def fetchDetailsBatch(self, place_ids):
+        details = await asyncio.gather(
+            *(self.fetchRestaurantDetails(place_id) for place_id in place_ids),
+            return_exceptions=True
+        )
+        return [d for d in details if isinstance(d, dict)]
 
     def updateImage(self):
         if self.originalPixmaps and len(self.originalPixmaps) > 0:
@@ -700,27 +2100,30 @@ class UpdatedSearchPage(QWidget):
                 QMessageBox.information(self, "Favorite Added", f"{current_restaurant.get('name', 'Unnamed')} added to favorites.")
             self.saveFavorites()
 
-    def get_photo_pixmap(self, photo_reference, max_width=200):
+    def get_photo_pixmap(self, photo_reference, max_width=200, group="thumbnails"):
+        # Returns the in-memory pixmap, or None after queueing a background load
+        # (disk cache first, then the network) that reports through onPhotoReady.
         key = (photo_reference, max_width)
         if key in image_cache:
             return image_cache[key]
-        photo_url = (
-            "https://maps.googleapis.com/maps/api/place/photo"
-            f"?maxwidth={max_width}&photoreference={photo_reference}"
-            f"&key={GOOGLE_PLACES_API_KEY}"
-        )
-        try:
-            response = requests.get(photo_url, stream=True)
-            if response.status_code == 200:
-                image_data = response.content
-                pixmap = QPixmap()
-                if pixmap.loadFromData(image_data):
-                    image_cache[key] = pixmap
-                    return pixmap
-        except Exception as e:
-            print("Error downloading image:", e)
+        if photo_reference:
+            self.photo_loader.request(photo_reference, max_width, group)
         return None
 
+    def onPhotoReady(self, photo_reference, max_width, pixmap):
+        if max_width == 100:
+            for row in range(self.restaurant_list.count()):
+                item = self.restaurant_list.item(row)
+                photos = (item.data(Qt.UserRole) or {}).get("photos") or []
+                if photos and photos[0].get("photo_reference") == photo_reference:
+                    item.setIcon(QIcon(pixmap))
+        elif max_width == 500:
+            for index, ref in enumerate(self.photoReferences):
+                if ref == photo_reference and index < len(self.originalPixmaps):
+                    self.originalPixmaps[index] = pixmap
+                    if index == self.currentPhotoIndex:
+                        self.updateImage()
+
 # -----------------------------
 # Main Application Window
 # -----------------------------
@@ -732,11 +2135,18 @@ class RestaurantFinderWindow(QMainWindow):
         self.worker = None
         self.dark_mode = False
 
+        # Shared asyncio engine for every network request the window makes.
+        self.engine = NetworkEngine(self)
+
+        # Resolve the IP location in the background so "Near Me" can search immediately.
+        self.location_service = LocationService(self.engine, parent=self)
+        self.location_service.prewarm()
+
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
 
-        self.welcome_page = WelcomePage()
-        self.search_page = UpdatedSearchPage()
+        self.welcome_page = WelcomePage(self.location_service)
+        self.search_page = UpdatedSearchPage(self.engine)
         self.stacked_widget.addWidget(self.welcome_page)
         self.stacked_widget.addWidget(self.search_page)
         self.stacked_widget.setCurrentWidget(self.welcome_page)
@@ -745,11 +2155,15 @@ class RestaurantFinderWindow(QMainWindow):
         self.search_page.searchInitiated.connect(self.performSearch)
         self.welcome_page.darkModeToggled.connect(self.setDarkMode)
 
+        QApplication.instance().aboutToQuit.connect(self.search_page.summarizer.shutdown)
+        QApplication.instance().aboutToQuit.connect(self.engine.shutdown)
+
         self.applyStyle()
 
     def setDarkMode(self, enabled: bool):
         self.dark_mode = enabled
         self.search_page.setBubbleStyles(self.dark_mode)
+        self.search_page.map_view.setDarkMode(self.dark_mode)
         self.applyStyle()
         # Update details widget background explicitly.
         if hasattr(self.search_page, "details_widget"):
@@ -768,42 +2182,64 @@ class RestaurantFinderWindow(QMainWindow):
         self.search_page.location_input.setText(location)
         self.welcome_page.search_button.setEnabled(False)
         self.search_page.search_button.setEnabled(False)
-        self.worker = RestaurantSearchWorker(location)
+        # A new search cancels the previous one, including any background revalidation,
+        # and the thumbnail downloads its results started.
+        if self.worker is not None:
+            self.worker.cancel()
+        self.search_page.photo_loader.cancelGroup("thumbnails")
+        self.search_page.cancelSummaryPrefetch()
+        self.worker = RestaurantSearchWorker(self.engine, location, self)
         self.worker.results_ready.connect(self.handleSearchResults)
+        self.worker.results_refreshed.connect(self.handleResultsRefreshed)
         self.worker.error_occurred.connect(self.handleSearchError)
         self.worker.finished.connect(self.searchFinished)
         self.worker.start()
 
     def handleSearchResults(self, results):
+        # Ignore late signals from a worker that a newer search has replaced.
+        if self.sender() is not self.worker:
+            return
         self.search_page.all_restaurants = results
+        self.search_page.filters_applied = False
+        self.search_page.map_view.setPlaces(results, center=self.worker.center)
         self.search_page.restaurant_list.clear()
         for rest in results:
-            name = rest.get("name", "Unnamed")
-            vicinity = rest.get("vicinity", "No address")
-            item_text = f"{name}\n{vicinity}"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, rest)
-            if "photos" in rest and rest["photos"]:
-                photo_ref = rest["photos"][0].get("photo_reference")
-                pixmap = self.search_page.get_photo_pixmap(photo_ref, max_width=100)
-                if pixmap:
-                    item.setIcon(QIcon(pixmap))
-            self.search_page.restaurant_list.addItem(item)
+            self.search_page.restaurant_list.addItem(self.search_page.createRestaurantItem(rest))
         if self.search_page.restaurant_list.count() > 0:
             first_item = self.search_page.restaurant_list.item(0)
             self.search_page.restaurant_list.setCurrentItem(first_item)
             self.search_page.onRestaurantClicked(first_item)
+        self.search_page.prefetchSummaries(results)
         self.stacked_widget.setCurrentWidget(self.search_page)
+        self.stopSearchIndicators()
+
+    def handleResultsRefreshed(self, results):
+        if self.sender() is not self.worker:
+            return
+        self.search_page.patchRestaurantList(results)
 
     def handleSearchError(self, error_msg):
+        if self.sender() is not self.worker:
+            return
         QMessageBox.critical(self, "Search Error", f"Error during search:\n{error_msg}")
 
     def searchFinished(self):
+        worker = self.sender()
+        if worker is self.worker:
+            self.stopSearchIndicators()
+        worker.deleteLater()
+
+    def stopSearchIndicators(self):
         self.welcome_page.stopLoadingAnimation()
         self.search_page.search_button.setEnabled(True)
         self.welcome_page.search_button.setEnabled(True)
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Needed for the summarizer's process pool in frozen builds
+    if len(sys.argv) > 1 and sys.argv[1] == "--cache-server":
+        # Run the shared cache server instead of the GUI: FoodFinder.py --cache-server [address]
+        runCacheServer(sys.argv[2] if len(sys.argv) > 2 else CACHE_SERVER_ADDRESS or DEFAULT_CACHE_SERVER_ADDRESS)
+        sys.exit(0)
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
     QApplication.instance().setStyleSheet(LIGHT_STYLE)